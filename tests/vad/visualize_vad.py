@@ -6,68 +6,154 @@ Visualizes audio waveform alongside VAD speech probability to help
 evaluate VAD detection accuracy.
 
 Usage:
-    python3 visualize_vad.py <audio_file> <vad_json_file> [output_image]
+    python3 visualize_vad.py [options] <audio_file> <vad_json_file> [output_image]
+    python3 visualize_vad.py [options] --batch <directory>
+    python3 visualize_vad.py [options] --segments-only <audio_file> <vad_json_file> [output_json]
+
+Options:
+    --min-speech SEC    Drop speech segments shorter than SEC seconds
+    --min-silence SEC   Merge speech segments separated by less than SEC seconds
 
 Example:
     python3 visualize_vad.py vad_test_en.wav vad_analysis.json vad_result.png
 
+Batch mode visualizes every VAD JSON file in a directory (<name>_vad.json
+or <name>.json) that has a matching <name>.wav next to it, in parallel
+across CPUs. Each image is saved next to its JSON file as
+<json name>_visualization.png.
+
+Segments-only mode skips plotting (and matplotlib) entirely: it writes the
+detected speech segments as JSON to output_json (stdout if omitted) and the
+summary to stderr.
+
+Every mode caches the parsed VAD columns in <json name>.npz next to each
+VAD JSON file (e.g. vad_test_en_vad.npz), reused while it is newer than the
+JSON. The input directory must therefore be writable for the cache to be
+saved; if it is not, a warning is printed and the JSON is parsed each run.
+
 Requirements:
     pip install numpy matplotlib
+    # matplotlib is not needed for --segments-only
 
 Optional (for better audio loading):
     pip install librosa
     # or just use wave module (built-in, supports WAV only)
+
+Optional (for non-WAV audio without spawning ffmpeg):
+    pip install soundfile samplerate
+
+Optional (for faster VAD JSON loading):
+    pip install orjson
+
+Optional (for fast min-speech/min-silence segment filtering):
+    pip install numba
 """
 
+import contextlib
+import functools
+import io
 import json
+import os
 import sys
 import wave
 import struct
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 try:
     import numpy as np
-    # Use non-interactive backend for saving files without display
-    import matplotlib
-    matplotlib.use('Agg')
-    import matplotlib.pyplot as plt
-    from matplotlib.patches import Patch
 except ImportError:
     print("Error: Required packages not found.")
     print("Install with: pip install numpy matplotlib")
     sys.exit(1)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Scale factor mapping int16 PCM to [-1, 1]
+INT16_SCALE = np.float32(1.0 / 32768.0)
+
+# Column dtypes for VAD data: times stay float64 (monotonic over long
+# sessions) and probabilities stay float64 so thresholding matches the
+# analyzer's is_speech exactly. RMS values are stored as float32 to halve
+# their memory in the columns and the .npz cache; matplotlib upcasts plot
+# data to float64, so this does not change plotting cost.
+VAD_TIME_DTYPE = np.float64
+VAD_PROBABILITY_DTYPE = np.float64
+VAD_VALUE_DTYPE = np.float32
+
+# Per-channel weights that average stereo int16 PCM and normalize it in one step
+STEREO_DOWNMIX_WEIGHTS = np.array([0.5 / 32768.0, 0.5 / 32768.0], dtype=np.float32)
+
+
+def _import_pyplot():
+    """Import pyplot on first use, so segments-only runs never load matplotlib."""
+    try:
+        import matplotlib
+        # Use non-interactive backend for saving files without display
+        matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+    except ImportError:
+        print("Error: Required packages not found.")
+        print("Install with: pip install numpy matplotlib")
+        sys.exit(1)
+
+    return plt
+
 
 def load_wav_audio(audio_path: str) -> tuple[np.ndarray, int]:
     """Load WAV audio file and return normalized samples and sample rate."""
-    with wave.open(audio_path, 'rb') as wf:
+    with open(audio_path, 'rb') as f, wave.open(f, 'rb') as wf:
         sample_rate = wf.getframerate()
         n_channels = wf.getnchannels()
         sample_width = wf.getsampwidth()
         n_frames = wf.getnframes()
 
-        raw_data = wf.readframes(n_frames)
-
-        # Convert bytes to numpy array based on sample width
+        # wave.open leaves the file positioned at the start of the data chunk,
+        # so samples can be read straight into an array without a bytes copy
+        count = n_frames * n_channels
         if sample_width == 2:  # 16-bit
-            audio = np.frombuffer(raw_data, dtype=np.int16)
+            audio = np.fromfile(f, dtype='<i2', count=count)
         elif sample_width == 1:  # 8-bit
-            audio = np.frombuffer(raw_data, dtype=np.uint8).astype(np.int16) - 128
+            audio = np.fromfile(f, dtype=np.uint8, count=count).astype(np.int16) - 128
         else:
             raise ValueError(f"Unsupported sample width: {sample_width}")
 
-        # Handle stereo by averaging channels
-        if n_channels == 2:
-            audio = audio.reshape(-1, 2).mean(axis=1).astype(np.int16)
+    # Handle stereo by averaging channels, normalizing to [-1, 1] in the same pass
+    if n_channels == 2:
+        audio_normalized = np.einsum('ij,j->i', audio.reshape(-1, 2), STEREO_DOWNMIX_WEIGHTS)
+    else:
+        audio_normalized = np.multiply(audio, INT16_SCALE, dtype=np.float32)
+
+    return audio_normalized, sample_rate
+
 
-        # Normalize to [-1, 1]
-        audio_normalized = audio.astype(np.float32) / 32768.0
+def load_audio_soundfile(audio_path: str, target_sr: int = 16000) -> tuple[np.ndarray, int]:
+    """Load audio using soundfile (libsndfile), resampling with samplerate if needed."""
+    import soundfile as sf
 
-        return audio_normalized, sample_rate
+    audio, sample_rate = sf.read(audio_path, dtype='float32', always_2d=False)
+    if audio.ndim == 2:
+        audio = audio.mean(axis=1, dtype=np.float32)
+
+    if sample_rate != target_sr:
+        import samplerate
+        # samplerate expects 1-D input for mono audio
+        audio = samplerate.resample(audio, target_sr / sample_rate, 'sinc_fastest').astype(np.float32, copy=False)
+
+    return audio, target_sr
 
 
 def load_audio_ffmpeg(audio_path: str, target_sr: int = 16000) -> tuple[np.ndarray, int]:
-    """Load audio using ffmpeg subprocess (supports more formats)."""
+    """Load audio in formats beyond WAV, via soundfile or an ffmpeg subprocess."""
+    try:
+        return load_audio_soundfile(audio_path, target_sr)
+    except (ImportError, RuntimeError):
+        # soundfile/samplerate not installed, or format unsupported by libsndfile
+        pass
+
     import subprocess
 
     cmd = [
@@ -83,53 +169,240 @@ def load_audio_ffmpeg(audio_path: str, target_sr: int = 16000) -> tuple[np.ndarr
         raise RuntimeError(f"ffmpeg failed: {result.stderr.decode()}")
 
     audio = np.frombuffer(result.stdout, dtype=np.int16)
-    audio_normalized = audio.astype(np.float32) / 32768.0
+    audio_normalized = np.multiply(audio, INT16_SCALE, dtype=np.float32)
 
     return audio_normalized, target_sr
 
 
 def load_vad_results(json_path: str) -> dict:
     """Load VAD analysis results from JSON file."""
+    if orjson is not None:
+        return orjson.loads(Path(json_path).read_bytes())
     with open(json_path, 'r') as f:
         return json.load(f)
 
 
-def find_speech_segments(data_points: list, threshold: float = 0.5) -> list[tuple[float, float]]:
-    """Extract continuous speech segments from VAD data points."""
-    segments = []
+def extract_columns(data_points: list) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Extract time, probability and RMS columns from VAD data points in one pass."""
+    n = len(data_points)
+    vad_times = np.empty(n, dtype=VAD_TIME_DTYPE)
+    vad_probs = np.empty(n, dtype=VAD_PROBABILITY_DTYPE)
+    vad_rms = np.empty(n, dtype=VAD_VALUE_DTYPE)
+
+    for i, point in enumerate(data_points):
+        vad_times[i] = point['time']
+        vad_probs[i] = point['probability']
+        vad_rms[i] = point['audio_rms']
+
+    return vad_times, vad_probs, vad_rms
+
+
+def load_vad_results_cached(json_path: str) -> dict:
+    """
+    Load VAD analysis results as columns, caching them in a .npz beside the JSON.
+
+    The cache is reused while it is at least as new as the JSON file, which
+    avoids re-parsing large data_points lists on repeated runs.
+
+    Returns:
+        Dict with the JSON's scalar fields (threshold, total_frames, ...) and
+        'data_points_arrays', a (time, probability, audio_rms) tuple of arrays
+    """
+    json_file = Path(json_path)
+    npz_path = json_file.with_suffix('.npz')
+
+    if npz_path.exists() and npz_path.stat().st_mtime >= json_file.stat().st_mtime:
+        try:
+            with np.load(npz_path) as cache:
+                if cache['probability'].dtype != VAD_PROBABILITY_DTYPE:
+                    # Narrowed probabilities cannot be thresholded exactly
+                    raise ValueError(f"probability dtype is {cache['probability'].dtype}")
+                vad_data = {key[len('meta_'):]: cache[key].item()
+                            for key in cache.files if key.startswith('meta_')}
+                # Caches written by other tools may hold float64 RMS values
+                vad_data['data_points_arrays'] = (
+                    cache['time'].astype(VAD_TIME_DTYPE, copy=False),
+                    cache['probability'],
+                    cache['audio_rms'].astype(VAD_VALUE_DTYPE, copy=False),
+                )
+            return vad_data
+        except Exception as e:
+            # Truncated, corrupt or outdated cache: rebuild it from the JSON
+            print(f"  Ignoring unusable VAD cache {npz_path}: {e}")
+
+    raw = load_vad_results(json_path)
+    vad_data = {key: value for key, value in raw.items()
+                if key != 'data_points' and isinstance(value, (bool, int, float, str))}
+    vad_times, vad_probs, vad_rms = extract_columns(raw['data_points'])
+    vad_data['data_points_arrays'] = (vad_times, vad_probs, vad_rms)
+
+    # Write to a temporary file and rename it into place, so an interrupted
+    # save never leaves a truncated cache that looks newer than the JSON
+    tmp_path = npz_path.with_name(f'{npz_path.name}.{os.getpid()}.tmp')
+    try:
+        with open(tmp_path, 'wb') as tmp:
+            np.savez(tmp, time=vad_times, probability=vad_probs, audio_rms=vad_rms,
+                     **{f'meta_{key}': value for key, value in vad_data.items() if key != 'data_points_arrays'})
+        os.replace(tmp_path, npz_path)
+    except OSError as e:
+        print(f"  Could not write VAD cache {npz_path}: {e}")
+        with contextlib.suppress(OSError):
+            tmp_path.unlink()
+
+    return vad_data
+
+
+def envelope_downsample(x: np.ndarray, target_points: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Reduce a signal to a min/max envelope for plotting.
+
+    Splits the signal into at most target_points buckets and keeps each
+    bucket's minimum and maximum, so peaks stay visible while the number of
+    vertices handed to matplotlib is bounded.
+
+    Returns:
+        Tuple of (sample positions, envelope values), each of length
+        2 * number of buckets.
+    """
+    bucket = -(-len(x) // target_points)  # ceil division
+    n_buckets = -(-len(x) // bucket)
+
+    # Pad the last bucket with the final sample so min/max are unaffected
+    padded = np.pad(x, (0, n_buckets * bucket - len(x)), mode='edge')
+    buckets = padded.reshape(n_buckets, bucket)
+
+    envelope = np.empty(2 * n_buckets, dtype=x.dtype)
+    envelope[0::2] = buckets.min(axis=1)
+    envelope[1::2] = buckets.max(axis=1)
+    positions = np.arange(2 * n_buckets) * (bucket / 2)
+
+    return positions, envelope
+
+
+def _find_segments_kernel(vad_times, vad_probs, threshold, min_speech, min_silence):
+    """
+    Speech segment state machine with duration filters.
+
+    Compiled with numba by _get_segments_kernel when numba is installed.
+
+    Gaps shorter than min_silence are merged into the surrounding speech, then
+    segments shorter than min_speech are dropped.
+    """
+    n = len(vad_times)
+    starts = np.empty(n, dtype=np.float64)
+    ends = np.empty(n, dtype=np.float64)
+    count = 0
     in_speech = False
     start_time = 0.0
 
-    for point in data_points:
-        is_speech = point['probability'] >= threshold
-        time = point['time']
-
-        if is_speech and not in_speech:
-            # Speech starts
-            in_speech = True
-            start_time = time
-        elif not is_speech and in_speech:
+    for i in range(n):
+        if vad_probs[i] >= threshold:
+            if not in_speech:
+                # Speech starts, or resumes after a gap too short to count as silence
+                in_speech = True
+                if count > 0 and vad_times[i] - ends[count - 1] < min_silence:
+                    count -= 1
+                    start_time = starts[count]
+                else:
+                    start_time = vad_times[i]
+        elif in_speech:
             # Speech ends
             in_speech = False
-            segments.append((start_time, time))
+            starts[count] = start_time
+            ends[count] = vad_times[i]
+            count += 1
 
     # Handle case where speech continues to end
-    if in_speech and data_points:
-        segments.append((start_time, data_points[-1]['time']))
+    if in_speech:
+        starts[count] = start_time
+        ends[count] = vad_times[n - 1]
+        count += 1
 
-    return segments
+    keep = ends[:count] - starts[:count] >= min_speech
+    return starts[:count][keep], ends[:count][keep]
 
 
-def visualize_vad(audio_path: str, vad_json_path: str, output_path: str = None):
+@functools.lru_cache(maxsize=None)
+def _get_segments_kernel():
     """
-    Create visualization comparing audio waveform with VAD probability.
+    Return the segment kernel, compiled with numba when it is installed.
+
+    numba is imported here rather than at module level because it is only
+    needed when duration filters are requested, and importing it costs more
+    than a whole --segments-only run.
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return _find_segments_kernel
+    return njit(cache=True)(_find_segments_kernel)
+
+
+def find_speech_segments(vad_times: np.ndarray, vad_probs: np.ndarray, threshold: float = 0.5,
+                         min_speech: float = 0.0, min_silence: float = 0.0) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Extract continuous speech segments from VAD time/probability arrays.
 
     Args:
-        audio_path: Path to the audio file
-        vad_json_path: Path to VAD analysis JSON file
-        output_path: Optional path to save the output image
+        vad_times: Frame times in seconds
+        vad_probs: Speech probability per frame
+        threshold: Probability at or above which a frame counts as speech
+        min_speech: Drop segments shorter than this many seconds
+        min_silence: Merge segments separated by gaps shorter than this many seconds
+
+    Returns:
+        Tuple of (segment start times, segment end times)
     """
-    # Load data
+    if len(vad_times) == 0:
+        return np.empty(0, dtype=np.float64), np.empty(0, dtype=np.float64)
+
+    if min_speech > 0 or min_silence > 0:
+        find_segments = _get_segments_kernel()
+        return find_segments(np.ascontiguousarray(vad_times, dtype=VAD_TIME_DTYPE),
+                             np.ascontiguousarray(vad_probs, dtype=VAD_PROBABILITY_DTYPE),
+                             float(threshold), float(min_speech), float(min_silence))
+
+    # Rising/falling edges of the speech mask mark segment boundaries
+    mask = vad_probs >= threshold
+    padded = np.concatenate(([False], mask, [False]))
+    diff = np.diff(padded.astype(np.int8))
+    starts = np.flatnonzero(diff == 1)
+    # A segment ends at the first non-speech point, or at the last point
+    # when speech continues to the end
+    ends = np.minimum(np.flatnonzero(diff == -1), len(vad_times) - 1)
+
+    return vad_times[starts], vad_times[ends]
+
+
+def add_speech_spans(ax, starts: np.ndarray, ends: np.ndarray, color: str, alpha: float):
+    """Highlight speech segments across the full height of an axes as a single artist."""
+    from matplotlib.collections import PolyCollection
+
+    # x in data coordinates, y in axes coordinates (same as axvspan)
+    verts = [[(start, 0), (start, 1), (end, 1), (end, 0)] for start, end in zip(starts, ends)]
+    spans = PolyCollection(verts, facecolor=color, alpha=alpha, edgecolor='none',
+                           transform=ax.get_xaxis_transform())
+    ax.add_collection(spans, autolim=False)
+
+
+def _plot_waveform(ax, wave_times: np.ndarray, wave_values: np.ndarray, is_envelope: bool,
+                   alpha: float, label: str = None):
+    """Plot the waveform, drawing a min/max envelope as one filled band."""
+    if is_envelope:
+        # Filling between bucket minima and maxima renders the same band as a
+        # zig-zag line through them, without stroking every vertical segment.
+        # The thin edge keeps flat stretches (min == max, e.g. digital
+        # silence) visible as a line, as with the non-decimated plot.
+        ax.fill_between(wave_times[0::2], wave_values[0::2], wave_values[1::2],
+                        linewidth=0.3, facecolor='#2196F3', edgecolor='#2196F3',
+                        alpha=alpha, label=label, rasterized=True)
+    else:
+        ax.plot(wave_times, wave_values, linewidth=0.3, color='#2196F3', alpha=alpha, label=label,
+                rasterized=True)
+
+
+def _load_inputs(audio_path: str, vad_json_path: str):
+    """Load audio samples and VAD columns, printing a short description of each."""
     print(f"Loading audio: {audio_path}")
 
     # Try different audio loading methods
@@ -147,45 +420,75 @@ def visualize_vad(audio_path: str, vad_json_path: str, output_path: str = None):
     print(f"  Duration: {len(audio) / sample_rate:.2f} seconds")
 
     print(f"Loading VAD results: {vad_json_path}")
-    vad_data = load_vad_results(vad_json_path)
-    data_points = vad_data['data_points']
+    vad_data = load_vad_results_cached(vad_json_path)
+    vad_times, vad_probs, vad_rms = vad_data['data_points_arrays']
     threshold = vad_data.get('threshold', 0.5)
 
     print(f"  Threshold: {threshold}")
-    print(f"  Total frames: {vad_data.get('total_frames', len(data_points))}")
+    print(f"  Total frames: {vad_data.get('total_frames', len(vad_times))}")
     print(f"  Speech frames: {vad_data.get('speech_frames', 'N/A')}")
 
-    # Extract VAD data
-    vad_times = np.array([p['time'] for p in data_points])
-    vad_probs = np.array([p['probability'] for p in data_points])
-    vad_rms = np.array([p['audio_rms'] for p in data_points])
+    return audio, sample_rate, vad_times, vad_probs, vad_rms, threshold
 
-    # Find speech segments for highlighting
-    segments = find_speech_segments(data_points, threshold)
 
-    # Create figure with 4 subplots
-    fig, axes = plt.subplots(4, 1, figsize=(16, 12), sharex=True)
-    fig.suptitle(f'VAD Analysis: {Path(audio_path).name}', fontsize=14, fontweight='bold')
+def _create_figure():
+    """Create the 4-subplot figure and the twin axis used by the combined view."""
+    # Fixed margins instead of tight_layout: the layout never changes, so
+    # there is no need to measure text on every render
+    plt = _import_pyplot()
+    fig = plt.figure(figsize=(16, 12))
+    gs = fig.add_gridspec(4, 1, hspace=0.35, left=0.06, right=0.94, top=0.93, bottom=0.05)
+    axes = [fig.add_subplot(gs[i]) for i in range(4)]
+    for ax in axes[:-1]:
+        ax.sharex(axes[-1])
+        ax.tick_params(axis='x', labelbottom=False)
+    ax4b = axes[3].twinx()
+    return fig, axes, ax4b
 
-    # Time axis for audio waveform
-    audio_times = np.arange(len(audio)) / sample_rate
+
+def _render_into(fig, axes, ax4b, title: str, audio: np.ndarray, sample_rate: int,
+                 vad_times: np.ndarray, vad_probs: np.ndarray, vad_rms: np.ndarray,
+                 starts: np.ndarray, ends: np.ndarray, threshold: float):
+    """Draw one VAD analysis into an existing figure, replacing any previous content."""
+    from matplotlib.patches import Patch
+
+    for ax in (*axes, ax4b):
+        if ax.has_data():
+            ax.cla()
+
+    fig.suptitle(f'VAD Analysis: {title}', fontsize=14, fontweight='bold')
+
+    # Time axis for audio waveform, reduced to ~2 points per output pixel
+    # column (dpi=150) so long recordings do not produce huge line paths.
+    # Plots 1 and 4 share the same reduced waveform.
+    target_points = int(fig.get_size_inches()[0] * 150 * 2)
+    is_envelope = len(audio) > target_points
+    if is_envelope:
+        wave_positions, wave_values = envelope_downsample(audio, target_points)
+        wave_times = wave_positions / sample_rate
+    else:
+        wave_times, wave_values = np.arange(len(audio)) / sample_rate, audio
 
     # === Plot 1: Audio Waveform ===
     ax1 = axes[0]
-    ax1.plot(audio_times, audio, linewidth=0.3, color='#2196F3', alpha=0.8)
+    _plot_waveform(ax1, wave_times, wave_values, is_envelope, alpha=0.8)
     ax1.set_ylabel('Amplitude', fontsize=10)
     ax1.set_title('Audio Waveform', fontsize=11, fontweight='bold')
     ax1.set_ylim(-1, 1)
     ax1.grid(True, alpha=0.3)
 
     # Highlight speech regions on waveform
-    for start, end in segments:
-        ax1.axvspan(start, end, alpha=0.15, color='green')
+    add_speech_spans(ax1, starts, ends, color='green', alpha=0.15)
+
+    # The fills under the VAD curves are decorative, so draw them from at
+    # most ~target_points frames; the lines keep every frame
+    fill_step = max(1, len(vad_times) // target_points)
+    fill_times = vad_times[::fill_step]
 
     # === Plot 2: VAD Speech Probability ===
     ax2 = axes[1]
     ax2.plot(vad_times, vad_probs, linewidth=1.5, color='#4CAF50', label='Speech Probability')
-    ax2.fill_between(vad_times, 0, vad_probs, alpha=0.3, color='#4CAF50')
+    ax2.fill_between(fill_times, 0, vad_probs[::fill_step], alpha=0.3, color='#4CAF50')
     ax2.axhline(y=threshold, color='#F44336', linestyle='--', linewidth=2, label=f'Threshold ({threshold})')
     ax2.set_ylabel('Probability', fontsize=10)
     ax2.set_title('VAD Speech Probability', fontsize=11, fontweight='bold')
@@ -196,22 +499,20 @@ def visualize_vad(audio_path: str, vad_json_path: str, output_path: str = None):
     # === Plot 3: Audio RMS (from VAD frames) ===
     ax3 = axes[2]
     ax3.plot(vad_times, vad_rms, linewidth=1, color='#FF9800', label='Frame RMS')
-    ax3.fill_between(vad_times, 0, vad_rms, alpha=0.3, color='#FF9800')
+    ax3.fill_between(fill_times, 0, vad_rms[::fill_step], alpha=0.3, color='#FF9800')
     ax3.set_ylabel('RMS Level', fontsize=10)
     ax3.set_title('Audio Energy (RMS per VAD frame)', fontsize=11, fontweight='bold')
     ax3.legend(loc='upper right', fontsize=9)
     ax3.grid(True, alpha=0.3)
 
     # Highlight speech regions
-    for start, end in segments:
-        ax3.axvspan(start, end, alpha=0.15, color='green')
+    add_speech_spans(ax3, starts, ends, color='green', alpha=0.15)
 
     # === Plot 4: Combined View (Waveform + Probability overlay) ===
     ax4 = axes[3]
-    ax4b = ax4.twinx()
 
     # Waveform (left axis)
-    ax4.plot(audio_times, audio, linewidth=0.3, color='#2196F3', alpha=0.6, label='Waveform')
+    _plot_waveform(ax4, wave_times, wave_values, is_envelope, alpha=0.6, label='Waveform')
     ax4.set_ylabel('Amplitude', color='#2196F3', fontsize=10)
     ax4.tick_params(axis='y', labelcolor='#2196F3')
     ax4.set_ylim(-1, 1)
@@ -219,13 +520,13 @@ def visualize_vad(audio_path: str, vad_json_path: str, output_path: str = None):
     # Probability (right axis)
     ax4b.plot(vad_times, vad_probs, linewidth=2, color='#F44336', label='VAD Probability')
     ax4b.axhline(y=threshold, color='#F44336', linestyle='--', linewidth=1, alpha=0.5)
+    ax4b.yaxis.set_label_position('right')  # cla() resets it to the left
     ax4b.set_ylabel('Speech Probability', color='#F44336', fontsize=10)
     ax4b.tick_params(axis='y', labelcolor='#F44336')
     ax4b.set_ylim(0, 1.05)
 
     # Highlight detected speech regions
-    for start, end in segments:
-        ax4.axvspan(start, end, alpha=0.2, color='#4CAF50')
+    add_speech_spans(ax4, starts, ends, color='#4CAF50', alpha=0.2)
 
     ax4.set_xlabel('Time (seconds)', fontsize=10)
     ax4.set_title('Combined View: Waveform + VAD Probability', fontsize=11, fontweight='bold')
@@ -239,9 +540,31 @@ def visualize_vad(audio_path: str, vad_json_path: str, output_path: str = None):
     ]
     ax4.legend(handles=legend_elements, loc='upper right', fontsize=9)
 
-    # Adjust layout
-    plt.tight_layout()
-    plt.subplots_adjust(top=0.95)
+
+def _print_summary(starts: np.ndarray, ends: np.ndarray, total_duration: float):
+    """Print detected speech segments and the overall speech ratio."""
+    print("\n=== Speech Segments Detected ===")
+    durations = ends - starts
+    total_speech_duration = float(durations.sum())
+    lines = [f"  Segment {i}: {start:.2f}s - {end:.2f}s (duration: {duration:.2f}s)"
+             for i, (start, end, duration) in enumerate(zip(starts, ends, durations), 1)]
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+    speech_ratio = total_speech_duration / total_duration * 100 if total_duration > 0 else 0
+    print(f"\nTotal speech: {total_speech_duration:.2f}s / {total_duration:.2f}s ({speech_ratio:.1f}%)")
+
+
+def _visualize_into(fig, axes, ax4b, audio_path: str, vad_json_path: str, output_path: str = None,
+                    min_speech: float = 0.0, min_silence: float = 0.0):
+    """Load, render, save and summarize one audio/VAD pair using an existing figure."""
+    audio, sample_rate, vad_times, vad_probs, vad_rms, threshold = _load_inputs(audio_path, vad_json_path)
+
+    # Find speech segments for highlighting
+    starts, ends = find_speech_segments(vad_times, vad_probs, threshold, min_speech, min_silence)
+
+    _render_into(fig, axes, ax4b, Path(audio_path).name, audio, sample_rate,
+                 vad_times, vad_probs, vad_rms, starts, ends, threshold)
 
     # Save the figure
     if output_path:
@@ -250,27 +573,298 @@ def visualize_vad(audio_path: str, vad_json_path: str, output_path: str = None):
         # Default output path
         save_path = Path(vad_json_path).stem + '_visualization.png'
 
-    plt.savefig(save_path, dpi=150, bbox_inches='tight')
+    # The figure margins are fixed; bbox_inches='tight' would add an extra
+    # layout pass over the whole figure on every save
+    fig.savefig(save_path, dpi=150)
     print(f"\nVisualization saved to: {save_path}")
-    plt.close(fig)
 
-    # Print summary
-    print("\n=== Speech Segments Detected ===")
-    total_speech_duration = 0
-    for i, (start, end) in enumerate(segments, 1):
-        duration = end - start
-        total_speech_duration += duration
-        print(f"  Segment {i}: {start:.2f}s - {end:.2f}s (duration: {duration:.2f}s)")
+    _print_summary(starts, ends, len(audio) / sample_rate)
 
-    total_duration = len(audio) / sample_rate
-    speech_ratio = total_speech_duration / total_duration * 100 if total_duration > 0 else 0
-    print(f"\nTotal speech: {total_speech_duration:.2f}s / {total_duration:.2f}s ({speech_ratio:.1f}%)")
+
+def get_audio_duration(audio_path: str) -> float:
+    """
+    Return audio duration in seconds, read from the file header where possible.
+
+    Tries the wave module (WAV only), then soundfile, then ffprobe; the audio
+    is only decoded if none of them can report the duration.
+    """
+    if audio_path.lower().endswith('.wav'):
+        try:
+            with wave.open(audio_path, 'rb') as wf:
+                return wf.getnframes() / wf.getframerate()
+        except (wave.Error, EOFError):
+            pass
+
+    try:
+        import soundfile as sf
+        return sf.info(audio_path).duration
+    except (ImportError, RuntimeError):
+        # soundfile not installed, or format unsupported by libsndfile
+        pass
+
+    import subprocess
+
+    cmd = [
+        'ffprobe', '-v', 'error',
+        '-show_entries', 'format=duration',
+        '-of', 'default=noprint_wrappers=1:nokey=1',
+        audio_path
+    ]
+
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        if result.returncode == 0:
+            return float(result.stdout.strip())
+    except (OSError, ValueError):
+        # ffprobe not installed, or no duration in the container header
+        pass
+
+    audio, sample_rate = load_audio_ffmpeg(audio_path)
+    return len(audio) / sample_rate
+
+
+def write_speech_segments(audio_path: str, vad_json_path: str, output_path: str = None,
+                          min_speech: float = 0.0, min_silence: float = 0.0):
+    """
+    Detect speech segments without plotting and write them as JSON.
+
+    Progress and the human-readable summary go to stderr so stdout stays
+    valid JSON when no output path is given.
+
+    Args:
+        audio_path: Path to the audio file (used for its duration)
+        vad_json_path: Path to VAD analysis JSON file
+        output_path: Optional path for the segments JSON (default: stdout)
+        min_speech: Drop segments shorter than this many seconds
+        min_silence: Merge segments separated by gaps shorter than this many seconds
+    """
+    with contextlib.redirect_stdout(sys.stderr):
+        print(f"Loading VAD results: {vad_json_path}")
+        vad_data = load_vad_results_cached(vad_json_path)
+        vad_times, vad_probs, _ = vad_data['data_points_arrays']
+        threshold = vad_data.get('threshold', 0.5)
+
+        starts, ends = find_speech_segments(vad_times, vad_probs, threshold, min_speech, min_silence)
+        total_duration = get_audio_duration(audio_path)
+        _print_summary(starts, ends, total_duration)
+
+    result = {
+        'audio_file': audio_path,
+        'threshold': threshold,
+        'min_speech': min_speech,
+        'min_silence': min_silence,
+        'total_duration': total_duration,
+        'total_speech': float((ends - starts).sum()),
+        'segments': np.column_stack((starts, ends)).tolist(),
+    }
+
+    if output_path:
+        with open(output_path, 'w') as f:
+            json.dump(result, f, indent=2)
+            f.write("\n")
+        print(f"\nSegments saved to: {output_path}", file=sys.stderr)
+    else:
+        json.dump(result, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+
+
+def visualize_vad(audio_path: str, vad_json_path: str, output_path: str = None,
+                  min_speech: float = 0.0, min_silence: float = 0.0):
+    """
+    Create visualization comparing audio waveform with VAD probability.
+
+    Args:
+        audio_path: Path to the audio file
+        vad_json_path: Path to VAD analysis JSON file
+        output_path: Optional path to save the output image
+        min_speech: Drop segments shorter than this many seconds
+        min_silence: Merge segments separated by gaps shorter than this many seconds
+    """
+    fig, axes, ax4b = _create_figure()
+    try:
+        _visualize_into(fig, axes, ax4b, audio_path, vad_json_path, output_path,
+                        min_speech, min_silence)
+    finally:
+        _import_pyplot().close(fig)
+
+
+def _visualize_pair(figure: tuple, pair: tuple[str, str, str],
+                    min_speech: float = 0.0, min_silence: float = 0.0) -> bool:
+    """
+    Visualize one (audio_path, vad_json_path, output_path) pair into a reused figure.
+
+    A failure is reported and does not stop the caller from moving on to the
+    next pair.
+
+    Returns:
+        True if the pair was visualized successfully
+    """
+    try:
+        _visualize_into(*figure, *pair, min_speech, min_silence)
+        return True
+    except Exception as e:
+        print(f"Error: failed to visualize {pair[1]}: {e}")
+        return False
+
+
+def visualize_vad_batch(pairs: list[tuple[str, str, str]],
+                        min_speech: float = 0.0, min_silence: float = 0.0) -> int:
+    """
+    Create visualizations for several audio/VAD pairs, reusing one figure.
+
+    Building the figure and axes once amortizes matplotlib setup across files;
+    each file's content is cleared and redrawn before saving. A file that
+    fails is reported and skipped.
+
+    Args:
+        pairs: List of (audio_path, vad_json_path, output_path) tuples;
+            output_path may be None to use the default name
+        min_speech: Drop segments shorter than this many seconds
+        min_silence: Merge segments separated by gaps shorter than this many seconds
+
+    Returns:
+        Number of pairs that failed
+    """
+    figure = _create_figure()
+    failures = 0
+    try:
+        for pair in pairs:
+            if not _visualize_pair(figure, pair, min_speech, min_silence):
+                failures += 1
+            print()
+    finally:
+        _import_pyplot().close(figure[0])
+
+    return failures
+
+
+def find_batch_pairs(directory: str) -> list[tuple[str, str, str]]:
+    """
+    Pair each VAD JSON file in a directory with its audio file.
+
+    <name>_vad.json (the Go analyzer's default output name) or <name>.json is
+    matched with <name>.wav in the same directory; JSON files without audio
+    are skipped.
+
+    Returns:
+        List of (audio_path, vad_json_path, output_path) tuples
+    """
+    pairs = []
+    for json_path in sorted(Path(directory).glob('*.json')):
+        stem = json_path.stem
+        audio_stem = stem[:-len('_vad')] if stem.endswith('_vad') else stem
+        audio_path = json_path.with_name(audio_stem + '.wav')
+        if not audio_path.exists():
+            print(f"Skipping {json_path}: audio file not found: {audio_path}")
+            continue
+
+        output_path = json_path.with_name(stem + '_visualization.png')
+        pairs.append((str(audio_path), str(json_path), str(output_path)))
+
+    return pairs
+
+
+# Figure reused by all files rendered in one worker process
+_worker_figure = None
+
+
+def _batch_worker(pair: tuple[str, str, str], min_speech: float = 0.0,
+                  min_silence: float = 0.0) -> tuple[bool, str]:
+    """Visualize one pair in a worker process, returning (success, captured output)."""
+    global _worker_figure
+    if _worker_figure is None:
+        _worker_figure = _create_figure()
+
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        ok = _visualize_pair(_worker_figure, pair, min_speech, min_silence)
+
+    return ok, output.getvalue()
+
+
+def visualize_vad_parallel(pairs: list[tuple[str, str, str]], max_workers: int = None,
+                           min_speech: float = 0.0, min_silence: float = 0.0) -> int:
+    """
+    Visualize audio/VAD pairs across worker processes.
+
+    Each worker keeps its own figure and handles failures like
+    visualize_vad_batch. Output from each file is printed in input order once
+    that file is done.
+
+    Args:
+        pairs: List of (audio_path, vad_json_path, output_path) tuples
+        max_workers: Number of processes (default: CPU count)
+        min_speech: Drop segments shorter than this many seconds
+        min_silence: Merge segments separated by gaps shorter than this many seconds
+
+    Returns:
+        Number of pairs that failed
+    """
+    if not pairs:
+        return 0
+
+    max_workers = min(max_workers or os.cpu_count() or 1, len(pairs))
+    if max_workers == 1:
+        # A single worker gains nothing from a process pool
+        return visualize_vad_batch(pairs, min_speech, min_silence)
+
+    worker = functools.partial(_batch_worker, min_speech=min_speech, min_silence=min_silence)
+    failures = 0
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        for ok, output in executor.map(worker, pairs):
+            print(output)
+            if not ok:
+                failures += 1
+
+    return failures
+
+
+def _pop_seconds_option(args: list, name: str) -> float:
+    """Remove '<name> SEC' from args and return SEC (0.0 if the option is absent)."""
+    if name not in args:
+        return 0.0
+
+    i = args.index(name)
+    try:
+        seconds = float(args[i + 1])
+    except (IndexError, ValueError):
+        seconds = -1.0
+    if not seconds >= 0:
+        print(f"Error: {name} requires a non-negative number of seconds")
+        sys.exit(1)
+
+    del args[i:i + 2]
+    return seconds
 
 
 def main():
-    if len(sys.argv) < 3:
+    args = sys.argv[1:]
+    min_speech = _pop_seconds_option(args, '--min-speech')
+    min_silence = _pop_seconds_option(args, '--min-silence')
+
+    if args and args[0] == '--batch':
+        if len(args) != 2 or not Path(args[1]).is_dir():
+            print("Usage: python3 visualize_vad.py [options] --batch <directory>")
+            sys.exit(1)
+
+        pairs = find_batch_pairs(args[1])
+        if not pairs:
+            print(f"Error: No VAD JSON files with matching audio found in: {args[1]}")
+            sys.exit(1)
+
+        print(f"Visualizing {len(pairs)} file(s)...\n")
+        failures = visualize_vad_parallel(pairs, min_speech=min_speech, min_silence=min_silence)
+        print(f"Done: {len(pairs) - failures} succeeded, {failures} failed")
+        sys.exit(1 if failures else 0)
+
+    segments_only = '--segments-only' in args
+    args = [arg for arg in args if arg != '--segments-only']
+
+    if not 2 <= len(args) <= 3:
         print(__doc__)
-        print("\nUsage: python3 visualize_vad.py <audio_file> <vad_json_file> [output_image]")
+        print("\nUsage: python3 visualize_vad.py [options] <audio_file> <vad_json_file> [output_image]")
+        print("       python3 visualize_vad.py [options] --batch <directory>")
+        print("       python3 visualize_vad.py [options] --segments-only <audio_file> <vad_json_file> [output_json]")
         print("\nExample:")
         print("  # First, run the Go analyzer to generate JSON:")
         print("  go run -tags vad vad_analyze.go")
@@ -279,9 +873,9 @@ def main():
         print("  python3 visualize_vad.py vad_test_en.wav vad_analysis.json")
         sys.exit(1)
 
-    audio_path = sys.argv[1]
-    vad_json_path = sys.argv[2]
-    output_path = sys.argv[3] if len(sys.argv) > 3 else None
+    audio_path = args[0]
+    vad_json_path = args[1]
+    output_path = args[2] if len(args) > 2 else None
 
     # Validate inputs
     if not Path(audio_path).exists():
@@ -294,7 +888,11 @@ def main():
         print("  go run -tags vad vad_analyze.go")
         sys.exit(1)
 
-    visualize_vad(audio_path, vad_json_path, output_path)
+    if segments_only:
+        write_speech_segments(audio_path, vad_json_path, output_path, min_speech, min_silence)
+        return
+
+    visualize_vad(audio_path, vad_json_path, output_path, min_speech, min_silence)
 
 
 if __name__ == '__main__':